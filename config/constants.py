@@ -8,3 +8,4 @@ PROJECT_ROOT = Path(__file__).parent.parent
 PROJECT_CONFIG_PATH = PROJECT_ROOT / "project_config.json"
 CONFIG_PACKAGE_PATH = PROJECT_ROOT / "config"
 CORE_UTILS_PACKAGE_PATH = PROJECT_ROOT / "core_utils"
+STUBS_CACHE_PATH = PROJECT_ROOT / ".cache" / "stubs"
@@ -3,10 +3,15 @@ Runner for generating and auto-formatting stubs.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import black
+import isort
+
 from config.cli_unifier import _run_console_tool, choose_python_exe, handles_console_error
 from config.console_logging import get_child_logger
+from config.constants import PROJECT_ROOT
 from config.generate_stubs.generator import ArgumentParser, NoDocStringForAMethodError
 
 logger = get_child_logger(__file__)
@@ -64,6 +69,32 @@ def sort_stub_imports(res_stub_path: Path) -> tuple[str, str, int]:
     return _run_console_tool("isort", args, debug=False)
 
 
+@lru_cache(maxsize=None)
+def _get_formatting_settings() -> tuple[black.Mode, isort.Config]:
+    """
+    Build black and isort settings once per process.
+
+    Returns:
+        tuple[black.Mode, isort.Config]: Black mode and isort config of the project
+    """
+    mode = black.Mode(line_length=100, target_versions={black.TargetVersion.PY311})
+    return mode, isort.Config(settings_path=str(PROJECT_ROOT))
+
+
+def format_stub_text(stub_code: str) -> str:
+    """
+    Autoformat stub code and sort its imports in memory.
+
+    Args:
+        stub_code (str): Stub code
+
+    Returns:
+        str: Formatted stub code
+    """
+    mode, isort_config = _get_formatting_settings()
+    return str(isort.code(black.format_str(stub_code, mode=mode), config=isort_config))
+
+
 def main() -> None:
     """
     Entrypoint for stub generation.
@@ -2,16 +2,41 @@
 Check the relevance of stubs.
 """
 
-# pylint: disable=too-many-locals, too-many-statements
+import hashlib
+import inspect
+import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from config.constants import PROJECT_CONFIG_PATH
+import black
+import isort
+
+from config.constants import PROJECT_CONFIG_PATH, PROJECT_ROOT, STUBS_CACHE_PATH
 from config.generate_stubs.generator import cleanup_code
-from config.generate_stubs.run_generator import format_stub_file, sort_stub_imports
+from config.generate_stubs.run_generator import format_stub_text
 from config.project_config import ProjectConfig
 
 
+@lru_cache(maxsize=None)
+def _load_project_config(
+    config_path: Path, mtime_ns: int  # pylint: disable=unused-argument
+) -> ProjectConfig:
+    """
+    Load project config once per its modification time.
+
+    Args:
+        config_path (Path): Path to project config
+        mtime_ns (int): Modification time of project config, invalidates cached config
+
+    Returns:
+        ProjectConfig: Project config
+    """
+    return ProjectConfig(config_path)
+
+
 def get_code(code_path: Path) -> str:
     """
     Get clear code from file.
@@ -22,91 +47,159 @@ def get_code(code_path: Path) -> str:
     Returns:
         str: Clear code
     """
-    with code_path.open(encoding="utf-8") as file:
-        code_text = file.read()
-    return code_text
+    return code_path.read_text(encoding="utf-8")
+
+
+def is_code_equal(code: str, stub_path: Path) -> bool:
+    """
+    Compare code with code from stub file.
+
+    BLAKE2b digests of raw bytes are compared first,
+    stub text with normalized newlines is compared only if digests differ.
+
+    Args:
+        code (str): Code to compare
+        stub_path (Path): Path to stub file
+
+    Returns:
+        bool: Whether code is equal or not
+    """
+    stub_bytes = stub_path.read_bytes()
+    code_digest = hashlib.blake2b(code.encode("utf-8")).digest()
+    stub_digest = hashlib.blake2b(stub_bytes).digest()
+    if code_digest == stub_digest:
+        return True
+    stub_code = stub_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return code == stub_code
+
+
+@lru_cache(maxsize=None)
+def _pipeline_fingerprint() -> str:
+    """
+    Get fingerprint of the stub formatting pipeline.
+
+    Covers black and isort versions, project settings and sources of the pipeline,
+    so cached stubs are invalidated once any of them changes.
+
+    Returns:
+        str: Pipeline fingerprint
+    """
+    digest = hashlib.blake2b(
+        f"{black.__version__}:{isort.__version__}".encode("utf-8"), digest_size=16
+    )
+    for path in (
+        PROJECT_ROOT / "pyproject.toml",
+        Path(inspect.getfile(cleanup_code)),
+        Path(inspect.getfile(format_stub_text)),
+    ):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def prune_stubs_cache() -> None:
+    """
+    Remove cached stubs made by other versions of the formatting pipeline.
+    """
+    if not STUBS_CACHE_PATH.exists():
+        return
+    for cache_entry in STUBS_CACHE_PATH.iterdir():
+        if cache_entry.name == _pipeline_fingerprint():
+            continue
+        if cache_entry.is_dir():
+            shutil.rmtree(cache_entry, ignore_errors=True)
+        else:
+            cache_entry.unlink(missing_ok=True)
 
 
-def clear_examples(lab_path: Path) -> None:
+def formatted_for(src_path: Path) -> str:
     """
-    Clean temp files.
+    Get cleaned, formatted and sorted stub of source code.
+
+    Result is cached by formatting pipeline fingerprint, source path, modification time
+    and size, so unchanged sources are not processed again. Only the latest stub of
+    each source is kept.
 
     Args:
-        lab_path (Path): Path to temp files
+        src_path (Path): Path to source code
+
+    Returns:
+        str: Formatted stub code
+    """
+    src_stat = src_path.stat()
+    path_key = hashlib.blake2b(str(src_path.resolve()).encode("utf-8"), digest_size=16)
+    stat_key = f"{src_stat.st_mtime_ns}-{src_stat.st_size}"
+    cache_dir = STUBS_CACHE_PATH / _pipeline_fingerprint()
+    cached_stub_path = cache_dir / f"{path_key.hexdigest()}-{stat_key}.py"
+    if cached_stub_path.exists():
+        return get_code(cached_stub_path)
+
+    formatted_code = format_stub_text(cleanup_code(src_path))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for outdated_stub_path in cache_dir.glob(f"{path_key.hexdigest()}-*.py"):
+        outdated_stub_path.unlink(missing_ok=True)
+    tmp_stub_path = cached_stub_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_stub_path.write_text(formatted_code, encoding="utf-8")
+    tmp_stub_path.replace(cached_stub_path)
+    return formatted_code
+
+
+def check_lab(lab_path: Path) -> tuple[bool, list[str]]:
     """
-    example_main_stub_path = lab_path / "example_main_stub.py"
-    example_start_stub_path = lab_path / "example_start_stub.py"
-    example_service_stub_path = lab_path / "example_service_stub.py"
-    example_start_stub_path.unlink()
-    example_main_stub_path.unlink()
-    example_service_stub_path.unlink()
+    Check the relevance of stubs of a single lab.
+
+    Args:
+        lab_path (Path): Path to lab
+
+    Returns:
+        tuple[bool, list[str]]: Whether stubs are relevant and messages to print
+    """
+    messages = [f"Processing {lab_path}..."]
+    main_stub_path = lab_path / "main_stub.py"
+    start_stub_path = lab_path / "start_stub.py"
+    service_stub_path = lab_path / "service_stub.py"
+
+    if (
+        not main_stub_path.exists()
+        or not start_stub_path.exists()
+        or not service_stub_path.exists()
+    ):
+        messages.append(
+            f"Ignoring {main_stub_path} or {start_stub_path} or {service_stub_path}: "
+            f"do not exist"
+        )
+        return True, messages
+
+    code_is_equal = True
+
+    if not is_code_equal(formatted_for(lab_path / "main.py"), main_stub_path):
+        code_is_equal = False
+        messages.append(f"You have different main and main_stub in {lab_path}")
+
+    if not is_code_equal(formatted_for(lab_path / "start.py"), start_stub_path):
+        code_is_equal = False
+        messages.append(f"You have different start and start_stub in {lab_path}")
+
+    if not is_code_equal(formatted_for(lab_path / "service.py"), service_stub_path):
+        code_is_equal = False
+        messages.append(f"You have different service and service_stub in {lab_path}")
+
+    return code_is_equal, messages
 
 
 def main() -> None:
     """
     Check the relevance of stubs.
     """
-    project_config = ProjectConfig(PROJECT_CONFIG_PATH)
+    project_config = _load_project_config(
+        PROJECT_CONFIG_PATH, PROJECT_CONFIG_PATH.stat().st_mtime_ns
+    )
     labs_paths = project_config.get_labs_paths()
-    code_is_equal = True
-    for lab_path in labs_paths:
-        print(f"Processing {lab_path}...")
-        main_stub_path = lab_path / "main_stub.py"
-        start_stub_path = lab_path / "start_stub.py"
-        service_stub_path = lab_path / "service_stub.py"
-
-        if (
-            not main_stub_path.exists()
-            or not start_stub_path.exists()
-            or not service_stub_path.exists()
-        ):
-            print(
-                f"Ignoring {main_stub_path} or {start_stub_path} or {service_stub_path}: "
-                f"do not exist"
-            )
-            continue
-
-        main_stub_code = get_code(main_stub_path)
-        start_stub_code = get_code(start_stub_path)
-        service_stub_code = get_code(service_stub_path)
-
-        clean_main = cleanup_code(lab_path / "main.py")
-        example_main_stub_path = lab_path / "example_main_stub.py"
-        with example_main_stub_path.open(mode="w", encoding="utf-8") as file:
-            file.write(clean_main)
-        format_stub_file(example_main_stub_path)
-        sort_stub_imports(example_main_stub_path)
-        formatted_main = get_code(example_main_stub_path)
-
-        clean_start = cleanup_code(lab_path / "start.py")
-        example_start_stub_path = lab_path / "example_start_stub.py"
-        with example_start_stub_path.open(mode="w", encoding="utf-8") as file:
-            file.write(clean_start)
-        format_stub_file(example_start_stub_path)
-        sort_stub_imports(example_start_stub_path)
-        formatted_start = get_code(example_start_stub_path)
-
-        clean_service = cleanup_code(lab_path / "service.py")
-        example_service_stub_path = lab_path / "example_service_stub.py"
-        with example_service_stub_path.open(mode="w", encoding="utf-8") as file:
-            file.write(clean_service)
-        format_stub_file(example_service_stub_path)
-        sort_stub_imports(example_service_stub_path)
-        formatted_service = get_code(example_service_stub_path)
-
-        if formatted_main != main_stub_code:
-            code_is_equal = False
-            print(f"You have different main and main_stub in {lab_path}")
-
-        if formatted_start != start_stub_code:
-            code_is_equal = False
-            print(f"You have different start and start_stub in {lab_path}")
-
-        if formatted_service != service_stub_code:
-            code_is_equal = False
-            print(f"You have different service and service_stub in {lab_path}")
-
-        clear_examples(lab_path)
+    prune_stubs_cache()
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(check_lab, labs_paths))
+    for _, messages in results:
+        print("\n".join(messages))
+    code_is_equal = all(lab_is_equal for lab_is_equal, _ in results)
     if code_is_equal:
         print("All stubs are relevant")
     sys.exit(not code_is_equal)
@@ -5,22 +5,45 @@ Crawler implementation.
 import datetime
 import json
 
-# pylint: disable=too-many-arguments, too-many-instance-attributes, unused-import, undefined-variable, unused-argument
+# pylint: disable=too-many-arguments, too-many-instance-attributes, undefined-variable, unused-argument
 import pathlib
 import re
 import shutil
-from random import randint
-from time import sleep
-from typing import Pattern, Union
+import threading
+from collections import deque
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Pattern, Union
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util import Retry
 
 from core_utils.article.article import Article
 from core_utils.article.io import to_meta, to_raw
 from core_utils.config_dto import ConfigDTO
-from core_utils.constants import ASSETS_PATH, CRAWLER_CONFIG_PATH, PROJECT_ROOT
+from core_utils.constants import (
+    ASSETS_PATH,
+    CRAWLER_CONFIG_PATH,
+    NUM_ARTICLES_UPPER_LIMIT,
+    PROJECT_ROOT,
+    TIMEOUT_LOWER_LIMIT,
+    TIMEOUT_UPPER_LIMIT,
+)
+
+_URL_PREFIXES = ('http://', 'https://', 'www.')
+_SITE_PREFIX = 'https://gtrksakha.ru/'
+_NEWS_PREFIX = 'https://gtrksakha.ru/news/20'
+_TITLE_XPATH = etree.XPath('//h1[@class="news-title"]')
+_LD_JSON_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()',
+                             smart_strings=False)
+_RUBRICS_XPATH = etree.XPath('//a[@class="badge badge-rubric me-2"]')
+_AUTHOR_RE = re.compile(r'"author"\s*:\s*\{[^{}]*?"name"\s*:\s*"([^"\\]*)"')
+_DATE_RE = re.compile(r'"datePublished"\s*:\s*"([^"\\]*)"')
+_SITE_TIMEZONE = datetime.timezone(datetime.timedelta(hours=9))
+_THREAD_LOCAL = threading.local()
+_FLUSH_EVERY = 10
 
 
 def is_valid_url(url: str) -> bool:
@@ -29,10 +52,7 @@ def is_valid_url(url: str) -> bool:
     Args:
         url: url string to check
     """
-    standard_pattern = r'https?://\S+|www\.\S+'
-    if re.match(standard_pattern, url) is None:
-        return False
-    return True
+    return isinstance(url, str) and url.startswith(_URL_PREFIXES)
 def url_type(url: str) -> str:
     """
     Checks url type.
@@ -41,9 +61,9 @@ def url_type(url: str) -> str:
     """
     if not is_valid_url(url):
         return "invalid"
-    if "https://gtrksakha.ru/" not in url:
+    if _SITE_PREFIX not in url:
         return "external"
-    if url.startswith('https://gtrksakha.ru/news/20'):
+    if url.startswith(_NEWS_PREFIX):
         return "article"
     return "internal"
 
@@ -51,48 +71,36 @@ class IncorrectSeedURLError(TypeError):
     """
     ...
     """
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+
+
 class NumberOfArticlesOutOfRangeError(ValueError):
     """
     ...
     """
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+
 
 class IncorrectNumberOfArticlesError(TypeError):
     """
     ...
     """
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+
 
 class IncorrectHeadersError(TypeError):
     """
     ...
     """
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+
 
 class IncorrectEncodingError(TypeError):
     """
     ...
     """
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+
 
 class IncorrectTimeoutError(ValueError):
     """
     ...
     """
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
 
 
 class IncorrectVerifyError(TypeError):
@@ -100,9 +108,84 @@ class IncorrectVerifyError(TypeError):
     ...
     """
 
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+
+def _is_list_of_str(value: Any) -> bool:
+    """
+    Check that value is a list of strings.
+
+    Args:
+        value (Any): Config value
+
+    Returns:
+        bool: Whether value is a list of strings
+    """
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _are_valid_urls(value: list) -> bool:
+    """
+    Check that every url in list starts with an allowed prefix.
+
+    Runs after _is_list_of_str, so items are already known to be strings.
+
+    Args:
+        value (list): Config value
+
+    Returns:
+        bool: Whether all urls are valid
+    """
+    return all(url.startswith(_URL_PREFIXES) for url in value)
+
+
+def _is_nonneg_int(value: Any) -> bool:
+    """
+    Check that value is a non-negative integer.
+
+    Args:
+        value (Any): Config value
+
+    Returns:
+        bool: Whether value is a non-negative integer
+    """
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _is_valid_timeout(value: Any) -> bool:
+    """
+    Check that value is a positive integer number of seconds within allowed range.
+
+    Args:
+        value (Any): Config value
+
+    Returns:
+        bool: Whether value is a valid timeout
+    """
+    return (isinstance(value, int) and not isinstance(value, bool)
+            and TIMEOUT_LOWER_LIMIT < value <= TIMEOUT_UPPER_LIMIT)
+
+
+_RULES: tuple[tuple[str, Callable[[Any], bool], type[Exception], str], ...] = (
+    ('seed_urls', _is_list_of_str,
+     IncorrectSeedURLError, 'Seed URLs must be a list of strings'),
+    ('seed_urls', _are_valid_urls,
+     IncorrectSeedURLError, 'seed URL does not match standard pattern "https?://(www.)?"'),
+    ('total_articles_to_find_and_parse', _is_nonneg_int,
+     IncorrectNumberOfArticlesError,
+     'total number of articles to parse is not integer or less than 0'),
+    ('total_articles_to_find_and_parse', lambda value: value <= NUM_ARTICLES_UPPER_LIMIT,
+     NumberOfArticlesOutOfRangeError, 'total number of articles is out of range from 1 to 150'),
+    ('headers', lambda value: isinstance(value, dict),
+     IncorrectHeadersError, 'headers are not in a form of dictionary'),
+    ('encoding', lambda value: isinstance(value, str),
+     IncorrectEncodingError, 'encoding must be specified as a string'),
+    ('timeout', _is_valid_timeout,
+     IncorrectTimeoutError, 'timeout value must be a positive integer less than 60'),
+    ('should_verify_certificate', lambda value: isinstance(value, bool),
+     IncorrectVerifyError, 'verify certificate value must either be True or False'),
+    ('headless_mode', lambda value: isinstance(value, bool),
+     IncorrectVerifyError, 'headless mode value must either be True or False'),
+)
+
 
 class Config:
     """
@@ -117,6 +200,7 @@ class Config:
             path_to_config (pathlib.Path): Path to configuration.
         """
         self.path_to_config = path_to_config
+        self._raw = self._load_raw()
         self._validate_config_content()
         prepare_environment(ASSETS_PATH)
         values = self._extract_config_content()
@@ -127,6 +211,23 @@ class Config:
         self._encoding = values.encoding
         self._should_verify_certificate = values.should_verify_certificate
         self._headless_mode = values.headless_mode
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.verify = self._should_verify_certificate
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def _load_raw(self) -> dict:
+        """
+        Read config file once so that validation and extraction share its content.
+
+        Returns:
+            dict: Raw config content
+        """
+        config_values_dict: dict = json.loads(self.path_to_config.read_bytes())
+        return config_values_dict
 
     def _extract_config_content(self) -> ConfigDTO:
         """
@@ -135,58 +236,23 @@ class Config:
         Returns:
             ConfigDTO: Config values
         """
-        with open(self.path_to_config, 'r', encoding='utf-8') as file:
-            config_values_dict = json.load(file)
-            config_values = ConfigDTO(config_values_dict['seed_urls'],
-                                      config_values_dict['total_articles_to_find_and_parse'],
-                                      config_values_dict['headers'],
-                                      config_values_dict['encoding'],
-                                      config_values_dict['timeout'],
-                                      config_values_dict['should_verify_certificate'],
-                                      config_values_dict['headless_mode'])
-        return config_values
+        config_values_dict = self._raw
+        return ConfigDTO(config_values_dict['seed_urls'],
+                         config_values_dict['total_articles_to_find_and_parse'],
+                         config_values_dict['headers'],
+                         config_values_dict['encoding'],
+                         config_values_dict['timeout'],
+                         config_values_dict['should_verify_certificate'],
+                         config_values_dict['headless_mode'])
 
     def _validate_config_content(self) -> None:
         """
         Ensure configuration parameters are not corrupt.
         """
-        with open(self.path_to_config, 'r', encoding='utf-8') as file:
-            config_values_dict = json.load(file)
-
-            if (not (isinstance(config_values_dict['seed_urls'], list)
-                     and all(isinstance(seed_url, str)
-                             for seed_url in config_values_dict['seed_urls']))):
-                raise IncorrectSeedURLError('Seed URLs must be a list of strings')
-            for seed_url in config_values_dict['seed_urls']:
-                if not is_valid_url(seed_url):
-                    raise IncorrectSeedURLError(
-                        'seed URL does not match standard pattern "https?://(www.)?"')
-
-            if (not (isinstance(config_values_dict['total_articles_to_find_and_parse'], int) and
-                     config_values_dict['total_articles_to_find_and_parse'] >= 0) or
-                    isinstance(config_values_dict['total_articles_to_find_and_parse'], bool)):
-                raise IncorrectNumberOfArticlesError(
-                    'total number of articles to parse is not integer or less than 0')
-
-            if config_values_dict['total_articles_to_find_and_parse'] > 150:
-                raise NumberOfArticlesOutOfRangeError(
-                    'total number of articles is out of range from 1 to 150')
-
-            if not isinstance(config_values_dict['headers'], dict):
-                raise IncorrectHeadersError('headers are not in a form of dictionary')
-
-            if not isinstance(config_values_dict['encoding'], str):
-                raise IncorrectEncodingError('encoding must be specified as a string')
-
-            if (not isinstance(config_values_dict['timeout'], int) or
-                    config_values_dict['timeout'] not in range(1, 61)):
-                raise IncorrectTimeoutError('timeout value must be a positive integer less than 60')
-
-            if not isinstance(config_values_dict['should_verify_certificate'], bool):
-                raise IncorrectVerifyError('verify certificate value must either be True or False')
-
-            if not isinstance(config_values_dict['headless_mode'], bool):
-                raise IncorrectVerifyError('headless mode value must either be True or False')
+        config_values_dict = self._raw
+        for key, is_valid, error, message in _RULES:
+            if not is_valid(config_values_dict[key]):
+                raise error(message)
 
     def get_seed_urls(self) -> list[str]:
         """
@@ -251,25 +317,93 @@ class Config:
         """
         return self._headless_mode
 
+    def get_session(self) -> requests.Session:
+        """
+        Retrieve session shared by all requests.
+
+        Returns:
+            requests.Session: Session with pooled keep-alive connections, headers
+                and certificate verification set
+        """
+        return self._session
 
-def make_request(url: str, config: Config) -> requests.models.Response:
+
+def make_request(url: str, config: Config, stream: bool = False) -> requests.models.Response:
     """
     Deliver a response from a request with given configuration.
 
     Args:
         url (str): Site url
         config (Config): Configuration
+        stream (bool): Whether to defer downloading of response body
 
     Returns:
         requests.models.Response: A response from a request
     """
-    # sleep(randint(1, 10))
-    response = requests.get(url,headers=config.get_headers(),
-                            timeout=config.get_timeout(),
-                            verify=config.get_verify_certificate())
+    session = config.get_session()
+    # passed explicitly, otherwise REQUESTS_CA_BUNDLE would override session.verify=False
+    response = session.get(url, timeout=config.get_timeout(), verify=session.verify,
+                           stream=stream)
+    response.encoding = config.get_encoding()
     return response
 
 
+def get_html_parser(encoding: str) -> html.HTMLParser:
+    """
+    Retrieve lxml HTML parser of current thread, creating it once per thread and encoding.
+
+    Args:
+        encoding (str): Encoding of pages to parse
+
+    Returns:
+        lxml.html.HTMLParser: Reusable HTML parser
+    """
+    if getattr(_THREAD_LOCAL, 'encoding', None) != encoding:
+        _THREAD_LOCAL.parser = html.HTMLParser(encoding=encoding)
+        _THREAD_LOCAL.encoding = encoding
+    parser: html.HTMLParser = _THREAD_LOCAL.parser
+    return parser
+
+
+def iter_anchors(response: requests.models.Response) -> Iterator[etree._Element]:
+    """
+    Parse streamed response body chunk by chunk and yield anchors as soon as they are closed.
+
+    Stopping the iteration leaves the rest of the body undownloaded.
+
+    Args:
+        response (requests.models.Response): Response opened with stream=True
+
+    Yields:
+        lxml.etree._Element: Anchor element
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='a', encoding=response.encoding)
+    for chunk in response.iter_content(chunk_size=8192):
+        parser.feed(chunk)
+        for _, anchor in parser.read_events():
+            yield anchor
+    parser.close()
+    for _, anchor in parser.read_events():
+        yield anchor
+
+
+def iter_hrefs(response: requests.models.Response, prefix: str) -> Iterator[str]:
+    """
+    Yield links of streamed response body anchors which start with prefix.
+
+    Args:
+        response (requests.models.Response): Response opened with stream=True
+        prefix (str): Beginning of links to yield
+
+    Yields:
+        str: Link of an anchor
+    """
+    for anchor in iter_anchors(response):
+        href = anchor.get('href')
+        if href and href.startswith(prefix):
+            yield str(href)
+
+
 class Crawler:
     """
     Crawler implementation.
@@ -287,41 +421,67 @@ class Crawler:
         """
         self.config = config
         self.urls = []
+        self._seen_urls: set[str] = set(self.get_search_urls())
 
-    def _extract_url(self, article_bs: BeautifulSoup) -> str:
+    def _extract_url(self, hrefs: Iterator[str]) -> str:
         """
         Find and retrieve url from HTML.
 
+        Consumes hrefs only up to the returned url, so repeated calls with the same
+        iterator walk each page once in total.
+
         Args:
-            article_bs (bs4.BeautifulSoup): BeautifulSoup instance
+            hrefs (Iterator[str]): Article links of a page not yet looked through
 
         Returns:
             str: Url from HTML
         """
-        urls = article_bs.find_all('a',
-                                   href=lambda href:
-                                   href and url_type(href)=="article")
-        unique_hrefs = list(set(url['href'] for url in urls))
-        for url_href in unique_hrefs:
-            if not isinstance(url_href, str):
-                return ''
-            if url_href not in self.urls and url_href not in self.get_search_urls():
+        for url_href in hrefs:
+            if url_href not in self._seen_urls:
                 return url_href
         return ''
 
+    def _collect_hrefs(self, page_url: str) -> list[str]:
+        """
+        Download page and collect article links from it.
+
+        It does not change crawler state, so seed pages can be crawled from worker threads.
+
+        Args:
+            page_url (str): Url of page to crawl
+
+        Returns:
+            list[str]: Unique article links of the page, at most as many as articles to find.
+                If the connection fails, links read before the failure are kept
+        """
+        hrefs: dict[str, None] = {}
+        try:
+            with make_request(page_url, self.config, stream=True) as response:
+                if response.status_code != 200:
+                    return []
+                for href in iter_hrefs(response, _NEWS_PREFIX):
+                    hrefs[href] = None
+                    if len(hrefs) >= self.config.get_num_articles():
+                        break
+        except requests.exceptions.RequestException:
+            pass
+        return list(hrefs)
+
     def find_articles(self) -> None:
         """
         Find articles.
         """
-        for seed_url in self.config.get_seed_urls():
-            response = make_request(seed_url, self.config)
-            if response.status_code == 200:
-                article_bs = BeautifulSoup(response.text, 'lxml')
-                while len(self.urls) < self.config.get_num_articles():
-                    extracted_url = self._extract_url(article_bs)
-                    if extracted_url=='':
-                        break
-                    self.urls.append(extracted_url)
+        seed_urls = self.get_search_urls()
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(seed_urls)))) as executor:
+            seeds_hrefs = list(executor.map(self._collect_hrefs, seed_urls))
+        for seed_hrefs in seeds_hrefs:
+            hrefs = iter(seed_hrefs)
+            while len(self.urls) < self.config.get_num_articles():
+                extracted_url = self._extract_url(hrefs)
+                if extracted_url=='':
+                    break
+                self.urls.append(extracted_url)
+                self._seen_urls.add(extracted_url)
 
     def get_search_urls(self) -> list:
         """
@@ -350,32 +510,51 @@ class CrawlerRecursive(Crawler):
         super().__init__(config)
         self.start_url = self.config.get_seed_urls()[0]
         self.urls_file_path = PROJECT_ROOT / "lab_5_scraper" / "recursive_crawler_urls.json"
-        if not self.urls_file_path.is_file() or not self.urls_file_path.read_text():
-            with self.urls_file_path.open('w') as urls_file:
-                json.dump([], urls_file)
+        saved_urls = self.urls_file_path.read_bytes() if self.urls_file_path.is_file() else b''
+        if saved_urls.strip():
+            self.urls = json.loads(saved_urls)
+            self._seen_urls.update(self.urls)
+        self._dirty_since_flush = 0
 
+    def _flush(self) -> None:
+        """
+        Atomically save collected URLs to file.
+        """
+        tmp_urls_file_path = self.urls_file_path.with_suffix('.tmp')
+        tmp_urls_file_path.write_bytes(json.dumps(self.urls).encode('utf-8'))
+        tmp_urls_file_path.replace(self.urls_file_path)
+        self._dirty_since_flush = 0
 
     def find_articles_bar(self, progress_bar_recursive: tqdm) -> None:
         """
         Find articles.
+
+        Pages are crawled breadth-first from the start URL, then the other seed URLs in case
+        it yields too few links, then previously saved URLs:
+        each page is requested and parsed once, and new article URLs found on it
+        are queued to be crawled next.
+
+        Args:
+            progress_bar_recursive (tqdm): Progress bar to update with each found URL
         """
-        with self.urls_file_path.open('r') as urls_file:
-            self.urls = json.load(urls_file)
-        progress_bar_recursive.update(1)
-        if len(self.urls) >= self.config.get_num_articles():
-            return
-        for seed_url in self.config.get_seed_urls():
-            response = make_request(seed_url, self.config)
-            if response.status_code == 200:
-                article_bs = BeautifulSoup(response.text, 'lxml')
+        pages_to_crawl = deque(dict.fromkeys([self.start_url, *self.get_search_urls(),
+                                              *self.urls]))
+        try:
+            while pages_to_crawl and len(self.urls) < self.config.get_num_articles():
+                hrefs = iter(self._collect_hrefs(pages_to_crawl.popleft()))
                 while len(self.urls) < self.config.get_num_articles():
-                    extracted_url = self._extract_url(article_bs)
+                    extracted_url = self._extract_url(hrefs)
                     if extracted_url=='':
                         break
                     self.urls.append(extracted_url)
-                    with self.urls_file_path.open('w') as urls_file:
-                        json.dump(self.urls, urls_file, indent=4)
-                    self.find_articles_bar(progress_bar_recursive)
+                    self._seen_urls.add(extracted_url)
+                    pages_to_crawl.append(extracted_url)
+                    progress_bar_recursive.update(1)
+                    self._dirty_since_flush += 1
+                    if self._dirty_since_flush >= _FLUSH_EVERY:
+                        self._flush()
+        finally:
+            self._flush()
 
 # 10
 # 4, 6, 8, 10
@@ -401,55 +580,63 @@ class HTMLParser:
         article = Article(full_url, article_id)
         self.article = article
 
-    def _fill_article_with_text(self, article_soup: BeautifulSoup) -> None:
+    def _fill_article_with_text(self, article_tree: html.HtmlElement) -> None:
         """
         Find text of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
+            article_tree (lxml.html.HtmlElement): Parsed HTML of article page
         """
-        try:
-            article_text = ''
-            article = article_soup.find('div', {"class":"news-fulltext"}).find_all('p')
-            for paragraph in article:
-                article_text += ''.join(paragraph.find_all(string=True)) + '\n'
-            self.article.text = article_text
-        except AttributeError:
-            article_text = ''
-            article = article_soup.find('div', {"class": "news-fulltext"}).find_all('p')
-            for paragraph in article:
-                article_text += ''.join(paragraph.find_all(string=True)) + '\n'
-            self.article.text = article_text
-
-    def _fill_article_with_meta_information(self, article_soup: BeautifulSoup) -> None:
+        container = article_tree.find('.//div[@class="news-fulltext"]')
+        if container is None:
+            self.article.text = ''
+            return
+        self.article.text = ''.join(f'{paragraph.text_content()}\n'
+                                    for paragraph in container.iter('p'))
+
+    def _fill_article_with_meta_information(self, article_tree: html.HtmlElement) -> None:
         """
         Find meta information of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
-        """
-        self.article.title = article_soup.find("h1", class_="news-title").get_text()
-        script_tag = article_soup.find('script', attrs={'type':"application/ld+json"})
-        json_data = json.loads(script_tag.text)
-        self.article.author = [json_data['author']['name']]
-        raw_date = str(json_data['datePublished'])
+            article_tree (lxml.html.HtmlElement): Parsed HTML of article page
+        """
+        self.article.title = _TITLE_XPATH(article_tree)[0].text_content()
+        ld_json = _LD_JSON_XPATH(article_tree)[0]
+        author_match = date_match = None
+        # regexes cannot tell nesting levels apart, so keys must be unique in the blob
+        if ld_json.count('"author"') == 1 and ld_json.count('"datePublished"') == 1:
+            author_match = _AUTHOR_RE.search(ld_json)
+            date_match = _DATE_RE.search(ld_json)
+        if author_match and date_match:
+            self.article.author = [author_match.group(1)]
+            raw_date = date_match.group(1)
+        else:
+            json_data = json.loads(ld_json)
+            authors = json_data['author']
+            if isinstance(authors, dict):
+                authors = [authors]
+            self.article.author = [author['name'] for author in authors]
+            raw_date = str(json_data['datePublished'])
         self.article.date = self.unify_date_format(raw_date)
-        self.article.topics = [rubric.get_text()
-                               for rubric in
-                               article_soup.find_all('a',
-                                                     {'class': "badge badge-rubric me-2"})]
+        self.article.topics = [rubric.text_content() for rubric in _RUBRICS_XPATH(article_tree)]
 
     def unify_date_format(self, date_str: str) -> datetime.datetime:
         """
         Unify date format.
 
+        Dates with an offset are converted to the site's local time (UTC+09:00).
+
         Args:
             date_str (str): Date in text format
 
         Returns:
             datetime.datetime: Datetime object
         """
-        return datetime.datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S+09:00')
+        date = datetime.datetime.fromisoformat(date_str)
+        if date.tzinfo is not None:
+            date = date.astimezone(_SITE_TIMEZONE)
+        return date.replace(tzinfo=None)
 
     def parse(self) -> Union[Article, bool, list]:
         """
@@ -460,9 +647,10 @@ class HTMLParser:
         """
         response = make_request(self.full_url, self.config)
         if response.status_code == 200:
-            article_bs = BeautifulSoup(response.text, 'lxml')
-            self._fill_article_with_text(article_bs)
-            self._fill_article_with_meta_information(article_bs)
+            article_tree = html.fromstring(response.content,
+                                           parser=get_html_parser(response.encoding))
+            self._fill_article_with_text(article_tree)
+            self._fill_article_with_meta_information(article_tree)
         return self.article
 
 
@@ -473,11 +661,9 @@ def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
     Args:
         base_path (Union[pathlib.Path, str]): Path where articles stores
     """
-    try:
-        pathlib.Path(base_path).mkdir(parents=True)
-    except FileExistsError:
-        shutil.rmtree(base_path)
-        pathlib.Path(base_path).mkdir(parents=True)
+    base_path = pathlib.Path(base_path)
+    shutil.rmtree(base_path, ignore_errors=True)
+    base_path.mkdir(parents=True, exist_ok=True)
 
 
 def main() -> None:
@@ -489,22 +675,23 @@ def main() -> None:
     crawler = Crawler(config=configuration)
     crawler.find_articles()
     progress_bar = tqdm(total=crawler.config.get_num_articles())
-    for i, full_url in enumerate(crawler.urls, start=1):
-        parser = HTMLParser(full_url=full_url, article_id=i, config=configuration)
-        article = parser.parse()
-        if isinstance(article, Article):
-            to_raw(article)
-            to_meta(article)
-            progress_bar.update(1)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(HTMLParser(full_url=full_url, article_id=i,
+                                              config=configuration).parse)
+                   for i, full_url in enumerate(crawler.urls, start=1)]
+        for future in as_completed(futures):
+            article = future.result()
+            if isinstance(article, Article):
+                to_raw(article)
+                to_meta(article)
+                progress_bar.update(1)
     progress_bar.close()
     print("Crawler finished working.")
 
     print("Recursive crawler started working. Progress:")
     recursive_crawler = CrawlerRecursive(config=configuration)
-    with recursive_crawler.urls_file_path.open('r') as urls_file:
-        urls_collected = json.load(urls_file)
     progress_bar_recursive = tqdm(total=recursive_crawler.config.get_num_articles(),
-                        initial=len(urls_collected))
+                                  initial=len(recursive_crawler.urls))
     recursive_crawler.find_articles_bar(progress_bar_recursive)
     progress_bar_recursive.close()
     print("Recursive crawler finished working.")
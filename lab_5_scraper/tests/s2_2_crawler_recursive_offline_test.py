@@ -0,0 +1,61 @@
+"""
+Recursive crawler URL state persistence validation.
+"""
+
+# pylint: disable=protected-access
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scraper.scraper import Config, CrawlerRecursive
+
+
+class CrawlerRecursiveStateTest(unittest.TestCase):
+    """
+    A class for testing saving and loading of recursive crawler URLs without network access.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CrawlerRecursiveStateTest class.
+        """
+        self.config = Config(CRAWLER_CONFIG_PATH)
+        (TEST_PATH / "lab_5_scraper").mkdir(parents=True, exist_ok=True)
+        self.project_root_patch = mock.patch("lab_5_scraper.scraper.PROJECT_ROOT", TEST_PATH)
+        self.project_root_patch.start()
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_flushed_urls_are_loaded_by_new_crawler(self) -> None:
+        """
+        Ensure URLs saved by _flush are restored by a new CrawlerRecursive instance.
+        """
+        urls = [
+            "https://gtrksakha.ru/news/2025/04/01/item1/",
+            "https://gtrksakha.ru/news/2025/04/02/item2/",
+        ]
+        crawler = CrawlerRecursive(self.config)
+        self.assertEqual(crawler.urls, [])
+
+        crawler.urls.extend(urls)
+        crawler._dirty_since_flush = len(urls)
+        crawler._flush()
+        self.assertEqual(crawler._dirty_since_flush, 0)
+        self.assertFalse(crawler.urls_file_path.with_suffix(".tmp").exists())
+
+        restored_crawler = CrawlerRecursive(self.config)
+        self.assertEqual(restored_crawler.urls, urls)
+        self.assertTrue(set(urls) <= restored_crawler._seen_urls)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CrawlerRecursiveStateTest class.
+        """
+        self.project_root_patch.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
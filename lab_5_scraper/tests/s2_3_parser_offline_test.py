@@ -0,0 +1,146 @@
+"""
+Parser meta information extraction validation on saved pages.
+"""
+
+# pylint: disable=protected-access
+import datetime
+import unittest
+
+import pytest
+from lxml import html
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scraper.scraper import Config, HTMLParser
+
+ARTICLE_PAGE = """<html><body>
+<h1 class="news-title">Заголовок новости</h1>
+<script type="application/ld+json">{ld_json}</script>
+<a class="badge badge-rubric me-2" href="/rubric/1">Общество</a>
+<a class="badge badge-rubric me-2" href="/rubric/2">Культура</a>
+</body></html>"""
+
+
+class HTMLParserMetaInformationTest(unittest.TestCase):
+    """
+    A class for testing meta information extraction without network access.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for HTMLParserMetaInformationTest class.
+        """
+        self.parser = HTMLParser(
+            "https://gtrksakha.ru/news/2025/04/01/item1/", 1, Config(CRAWLER_CONFIG_PATH)
+        )
+
+    def fill_meta(self, ld_json: str) -> None:
+        """
+        Fill article meta information from a page with given ld+json.
+
+        Args:
+            ld_json (str): Content of ld+json script of the page
+        """
+        article_tree = html.fromstring(ARTICLE_PAGE.format(ld_json=ld_json))
+        self.parser._fill_article_with_meta_information(article_tree)
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_meta_information_plain_author(self) -> None:
+        """
+        Ensure author and date are read from ld+json with a plain author object.
+        """
+        self.fill_meta(
+            '{"@type": "NewsArticle", "author": {"@type": "Person", "name": "Иван Петров"}, '
+            '"datePublished": "2025-04-01T10:20:30+09:00"}'
+        )
+        self.assertEqual(self.parser.article.title, "Заголовок новости")
+        self.assertEqual(self.parser.article.author, ["Иван Петров"])
+        self.assertEqual(self.parser.article.date, datetime.datetime(2025, 4, 1, 10, 20, 30))
+        self.assertEqual(self.parser.article.topics, ["Общество", "Культура"])
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_meta_information_escaped_author(self) -> None:
+        """
+        Ensure escaped author name is decoded.
+        """
+        self.fill_meta(
+            '{"author": {"name": "\\u0418\\u0432\\u0430\\u043d"}, '
+            '"datePublished": "2025-04-01T10:20:30+09:00"}'
+        )
+        self.assertEqual(self.parser.article.author, ["Иван"])
+        self.assertEqual(self.parser.article.date, datetime.datetime(2025, 4, 1, 10, 20, 30))
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_meta_information_list_of_authors(self) -> None:
+        """
+        Ensure all authors are read from ld+json with a list of authors.
+        """
+        self.fill_meta(
+            '{"author": [{"name": "Иван Петров"}, {"name": "Анна Сидорова"}], '
+            '"datePublished": "2025-04-01T10:20:30+09:00"}'
+        )
+        self.assertEqual(self.parser.article.author, ["Иван Петров", "Анна Сидорова"])
+        self.assertEqual(self.parser.article.date, datetime.datetime(2025, 4, 1, 10, 20, 30))
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_meta_information_nested_date_before_top_level(self) -> None:
+        """
+        Ensure top-level date is read when a nested object with date precedes it.
+        """
+        self.fill_meta(
+            '{"author": {"name": "Иван Петров"}, '
+            '"isPartOf": {"datePublished": "2020-01-01T00:00:00+09:00"}, '
+            '"datePublished": "2025-04-01T10:20:30+09:00"}'
+        )
+        self.assertEqual(self.parser.article.author, ["Иван Петров"])
+        self.assertEqual(self.parser.article.date, datetime.datetime(2025, 4, 1, 10, 20, 30))
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_meta_information_nested_author_before_top_level(self) -> None:
+        """
+        Ensure top-level author is read when a nested object with author precedes it.
+        """
+        self.fill_meta(
+            '{"mainEntity": {"author": {"name": "Wrong"}}, '
+            '"author": {"name": "Иван Петров"}, '
+            '"datePublished": "2025-04-01T10:20:30+09:00"}'
+        )
+        self.assertEqual(self.parser.article.author, ["Иван Петров"])
+        self.assertEqual(self.parser.article.date, datetime.datetime(2025, 4, 1, 10, 20, 30))
+
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_unify_date_format(self) -> None:
+        """
+        Ensure dates are converted to the site's local time.
+        """
+        expected = datetime.datetime(2025, 4, 1, 10, 20, 30)
+        for date_str in (
+            "2025-04-01T10:20:30+09:00",
+            "2025-04-01T04:20:30+03:00",
+            "2025-04-01T01:20:30+00:00",
+            "2025-04-01T10:20:30",
+        ):
+            with self.subTest(date_str=date_str):
+                self.assertEqual(self.parser.unify_date_format(date_str), expected)